@@ -29,8 +29,12 @@ class CameraProtocol(ABC):
         """Stop image acquisition."""
 
     @abstractmethod
-    def get_frame(self) -> npt.NDArray[np.uint8] | None:
-        """Get the next available frame. Returns None if no frame available."""
+    def get_frame(self) -> npt.NDArray[np.uint8] | npt.NDArray[np.uint16] | None:
+        """Get the next available frame. Returns None if no frame available.
+
+        Frames are (H, W) for mono or (H, W, C) for colour pixel formats,
+        uint8 for 8-bit formats and uint16 for 16-bit formats.
+        """
 
     @abstractmethod
     def set_exposure(self, exposure_us: int) -> None:
@@ -44,6 +48,14 @@ class CameraProtocol(ABC):
     def set_fps(self, fps: int) -> None:
         """Set target frame rate."""
 
+    @property
+    def pixel_format(self) -> str:
+        """Layout of frames returned by get_frame: "mono8" or "bgr8".
+
+        Only valid once connected; defaults to single-channel mono8.
+        """
+        return "mono8"
+
     @property
     @abstractmethod
     def is_connected(self) -> bool:
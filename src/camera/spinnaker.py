@@ -45,6 +45,67 @@ class _PyArrayObject(ctypes.Structure):
     ]
 
 
+_NPY_ARRAY_OWNDATA = 0x0004
+_FLAGS_OFFSET = _PyArrayObject.flags.offset
+
+
+def _clear_owndata_flag(arr: npt.NDArray[Any]) -> None:
+    """Clear OWNDATA flag to prevent numpy from freeing PySpin memory."""
+    ctypes.c_int.from_address(id(arr) + _FLAGS_OFFSET).value &= ~_NPY_ARRAY_OWNDATA
+
+
+# Sample dtypes for byte-aligned pixel formats, by bits per channel
+_SAMPLE_DTYPES: dict[int, np.dtype[Any]] = {
+    8: np.dtype(np.uint8),
+    16: np.dtype("<u2"),
+}
+
+
+def _copy_ndarray(image: Any) -> npt.NDArray[Any]:
+    """Copy a PySpin image through GetNDArray() with the OWNDATA workaround."""
+    raw = image.GetNDArray()
+    _clear_owndata_flag(raw)
+    return np.array(raw)
+
+
+def _copy_frame(image: Any) -> npt.NDArray[np.uint8] | npt.NDArray[np.uint16]:
+    """Copy a PySpin image into a NumPy-owned array with a single memcpy.
+
+    Reads the raw buffer through GetData(), so no array ever aliases
+    PySpin memory. Sample type and layout come from the image's bits per
+    pixel, channel count and row stride, so 16-bit and row-padded images
+    keep their shape. Packed formats (e.g. Mono12Packed) and images without
+    GetData() fall back to GetNDArray() with the OWNDATA workaround.
+
+    Args:
+        image: Complete PySpin ImagePtr.
+
+    Returns:
+        (H, W) or (H, W, C) uint8 or uint16 frame that stays valid after
+        Release().
+    """
+    try:
+        data = image.GetData()
+        height, width = image.GetHeight(), image.GetWidth()
+        channels = image.GetNumChannels()
+        bits_per_pixel = image.GetBitsPerPixel()
+        stride = image.GetStride()
+    except AttributeError:
+        return _copy_ndarray(image)
+
+    bits, remainder = divmod(bits_per_pixel, channels)
+    dtype = _SAMPLE_DTYPES.get(bits)
+    if dtype is None or remainder:
+        return _copy_ndarray(image)
+
+    # View the rows without their padding, then copy once
+    row_bytes = width * channels * dtype.itemsize
+    rows = np.frombuffer(data, dtype=np.uint8, count=height * stride)
+    frame = np.array(rows.reshape(height, stride)[:, :row_bytes]).view(dtype)
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    return frame.reshape(shape)
+
+
 class SpinnakerCamera(CameraProtocol):
     """FLIR Spinnaker camera implementation."""
 
@@ -130,6 +191,22 @@ class SpinnakerCamera(CameraProtocol):
             pass
         return "N/A"
 
+    @property
+    def pixel_format(self) -> str:
+        """Read the camera's PixelFormat node; anything but BGR8 is mono8."""
+        if self._camera is None:
+            return "mono8"
+        try:
+            node = PySpin.CEnumerationPtr(
+                self._camera.GetNodeMap().GetNode("PixelFormat")
+            )
+            if PySpin.IsReadable(node):
+                if node.GetCurrentEntry().GetSymbolic() == "BGR8":
+                    return "bgr8"
+        except Exception:
+            pass
+        return "mono8"
+
     def disconnect(self) -> None:
         """Release camera and system resources."""
         if self._acquiring:
@@ -199,11 +276,13 @@ class SpinnakerCamera(CameraProtocol):
             self._acquiring = False
             print("[Spinnaker] Acquisition stopped")
 
-    def get_frame(self) -> npt.NDArray[np.uint8] | None:
-        """Get next frame from camera as grayscale.
+    def get_frame(self) -> npt.NDArray[np.uint8] | npt.NDArray[np.uint16] | None:
+        """Get next frame from camera in its current pixel format.
 
-        Uses GetNDArray() with OWNDATA flag workaround for PySpin 4.3 memory bug.
-        Returns single-channel grayscale image (H, W).
+        Copies the image buffer via GetData(), sidestepping the PySpin 4.3
+        GetNDArray() OWNDATA memory bug.
+        Returns (H, W) for mono formats or (H, W, C) for colour formats,
+        uint8 for 8-bit and uint16 for 16-bit pixel formats.
         """
         if self._camera is None or not self._acquiring:
             return None
@@ -218,11 +297,7 @@ class SpinnakerCamera(CameraProtocol):
                 image_result.Release()
                 return None
 
-            # Get pixel format for conversion
-            raw = image_result.GetNDArray()
-            frame = np.array(raw)
-
-            return frame
+            return _copy_frame(image_result)
 
         except PySpin.SpinnakerException as e:
             print(f"[Spinnaker] Frame error: {e}")
@@ -32,7 +32,7 @@ from camera.mock import MockCamera
 from camera.protocol import CameraProtocol
 from camera.spinnaker import SPINNAKER_AVAILABLE, SpinnakerCamera
 from core.config import config
-from core.projection import ProjectionAnalyzer, ProjectionMode
+from core.projection import ProjectionAnalyzer, ProjectionMode, to_grayscale
 from ui.controls import ControlPanel
 from ui.projections import ProjectionPanel, YProjectionPanel
 from ui.viewport import CameraViewport
@@ -284,6 +284,7 @@ class MainWindow(QMainWindow):
 
         try:
             self._camera.connect()
+            self._viewport.set_pixel_format(self._camera.pixel_format)
             self._camera.set_exposure(self._controls.exposure)
             self._camera.set_gain(self._controls.gain)
             self._camera.set_fps(self._controls.fps)
@@ -344,14 +345,20 @@ class MainWindow(QMainWindow):
         show_x = self._controls.show_x_projection
         show_y = self._controls.show_y_projection
 
+        if not (show_x or show_y):
+            return
+
+        # Convert once and share between both analyzers
+        gray = to_grayscale(frame)
+
         if show_x:
-            data, stats = self._x_analyzer.analyze_x(frame)
+            data, stats = self._x_analyzer.analyze_x(gray)
             self._x_projection.update_projection(
                 data, stats, self._x_analyzer.normalize
             )
 
         if show_y:
-            data, stats = self._y_analyzer.analyze_y(frame)
+            data, stats = self._y_analyzer.analyze_y(gray)
             self._y_projection.update_projection(
                 data, stats, self._y_analyzer.normalize
             )
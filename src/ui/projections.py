@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import cv2
 import numpy as np
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
@@ -41,7 +42,7 @@ class ProjectionPlot(QFrame):
     """Widget that displays a 1D projection plot with axis labels.
 
     Features:
-    - Efficient QPainterPath rendering with downsampling
+    - Efficient QPainterPath rendering, downsampled to the plot width
     - Axis labels showing position and intensity
     - FWHM markers when available
     - Mean line indicator
@@ -50,6 +51,9 @@ class ProjectionPlot(QFrame):
     # Signal emitted when user clicks to expand
     expand_requested = Signal()
 
+    # Signal emitted when a resize drops the cached path
+    cache_invalidated = Signal()
+
     def __init__(self, orientation: str = "horizontal") -> None:
         """Initialize projection plot.
 
@@ -58,7 +62,7 @@ class ProjectionPlot(QFrame):
         """
         super().__init__()
         self._orientation = orientation
-        self._data: npt.NDArray[np.float64] | None = None
+        self._data: npt.NDArray[np.float32] | None = None
         self._stats: ProjectionStats | None = None
         self._normalized = False
         self._show_axis = True
@@ -69,6 +73,11 @@ class ProjectionPlot(QFrame):
         self._cached_fwhm_left: int | None = None
         self._cached_fwhm_right: int | None = None
 
+        # Downsampled float32 samples, keyed by (len(data), bins); survives
+        # resizes that leave the plot length unchanged
+        self._downsampled: npt.NDArray[np.float32] | None = None
+        self._downsample_key: tuple[int, int] | None = None
+
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Sunken)
         self.setStyleSheet("background-color: #1a1a1a; border: 1px solid #333;")
 
@@ -83,7 +92,7 @@ class ProjectionPlot(QFrame):
 
     def update_data(
         self,
-        data: npt.NDArray[np.float64],
+        data: npt.NDArray[np.float32],
         stats: ProjectionStats,
         normalized: bool = False,
     ) -> None:
@@ -98,6 +107,7 @@ class ProjectionPlot(QFrame):
         self._stats = stats
         self._normalized = normalized
         self._cached_path = None
+        self._downsample_key = None
         self.update()
 
     @property
@@ -120,6 +130,39 @@ class ProjectionPlot(QFrame):
         self._show_axis = show
         self.update()
 
+    @staticmethod
+    def _downsample(
+        data: npt.NDArray[np.float32], bins: int
+    ) -> npt.NDArray[np.float32]:
+        """Area-average data down to one sample per plot pixel."""
+        if bins < 2 or len(data) <= bins:
+            return data
+        row = data.reshape(1, -1).astype(np.float32, copy=False)
+        resized = cv2.resize(row, (bins, 1), interpolation=cv2.INTER_AREA)
+        return resized.ravel()  # type: ignore[return-value]
+
+    def _sampled(
+        self, data: npt.NDArray[np.float32], bins: int
+    ) -> npt.NDArray[np.float32]:
+        """Return data downsampled to bins as contiguous float32, cached."""
+        key = (len(data), bins)
+        if self._downsample_key != key or self._downsampled is None:
+            self._downsampled = np.ascontiguousarray(
+                self._downsample(data, bins), dtype=np.float32
+            )
+            self._downsample_key = key
+        return self._downsampled
+
+    @staticmethod
+    def _trace_path(
+        path: QPainterPath, xs: npt.NDArray[np.int32], ys: npt.NDArray[np.int32]
+    ) -> None:
+        """Append a polyline through the (xs, ys) pixel coordinates to path."""
+        points = zip(xs.tolist(), ys.tolist(), strict=True)
+        path.moveTo(*next(points))
+        for x, y in points:
+            path.lineTo(x, y)
+
     def _build_path(self) -> None:
         """Build cached QPainterPath for efficient drawing."""
         if self._data is None or len(self._data) == 0:
@@ -141,20 +184,15 @@ class ProjectionPlot(QFrame):
             plot_w = w - margin - axis_margin
             plot_h = h - margin - axis_margin
 
-            step = max(1, len(data) // 500)
-            sampled = data[::step]
+            sampled = self._sampled(data, plot_w)
 
             x_scale = plot_w / max(len(sampled) - 1, 1)
             y_scale = plot_h / data_range
 
-            x0 = axis_margin
-            y0 = h - axis_margin - int((sampled[0] - data_min) * y_scale)
-            path.moveTo(x0, y0)
-
-            for i in range(1, len(sampled)):
-                x = axis_margin + int(i * x_scale)
-                y = h - axis_margin - int((sampled[i] - data_min) * y_scale)
-                path.lineTo(x, y)
+            # Pixel coordinates for all samples in one vectorized pass
+            xs = axis_margin + (np.arange(len(sampled)) * x_scale).astype(np.int32)
+            ys = h - axis_margin - ((sampled - data_min) * y_scale).astype(np.int32)
+            self._trace_path(path, xs, ys)
 
             self._cached_mean_pos = (
                 h - axis_margin - int((self._stats.mean - data_min) * y_scale)
@@ -180,20 +218,14 @@ class ProjectionPlot(QFrame):
             plot_w = w - margin - axis_margin
             plot_h = h - margin - axis_margin
 
-            step = max(1, len(data) // 500)
-            sampled = data[::step]
+            sampled = self._sampled(data, plot_h)
 
             y_scale = plot_h / max(len(sampled) - 1, 1)
             x_scale = plot_w / data_range
 
-            x0 = axis_margin + int((sampled[0] - data_min) * x_scale)
-            y0 = margin
-            path.moveTo(x0, y0)
-
-            for i in range(1, len(sampled)):
-                x = axis_margin + int((sampled[i] - data_min) * x_scale)
-                y = margin + int(i * y_scale)
-                path.lineTo(x, y)
+            xs = axis_margin + ((sampled - data_min) * x_scale).astype(np.int32)
+            ys = margin + (np.arange(len(sampled)) * y_scale).astype(np.int32)
+            self._trace_path(path, xs, ys)
 
             self._cached_mean_pos = (
                 axis_margin + int((self._stats.mean - data_min) * x_scale)
@@ -346,6 +378,7 @@ class ProjectionPlot(QFrame):
         """Invalidate cache on resize."""
         super().resizeEvent(event)  # type: ignore[arg-type]
         self._cached_path = None
+        self.cache_invalidated.emit()
 
     def mouseDoubleClickEvent(self, event: object) -> None:
         """Emit expand signal on double-click."""
@@ -371,7 +404,7 @@ class ProjectionPanel(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self._visible = False
-        self._current_data: npt.NDArray[np.float64] | None = None
+        self._current_data: npt.NDArray[np.float32] | None = None
         self._current_stats: ProjectionStats | None = None
         self._current_normalized = False
         self._setup_ui()
@@ -457,7 +490,7 @@ class ProjectionPanel(QWidget):
 
     def update_projection(
         self,
-        data: npt.NDArray[np.float64],
+        data: npt.NDArray[np.float32],
         stats: ProjectionStats,
         normalized: bool = False,
     ) -> None:
@@ -484,8 +517,10 @@ class ProjectionPanel(QWidget):
         if self._current_data is None:
             return
 
+        # The analyzer reuses the projection buffer for the next frame;
+        # snapshot it so the dialog's plot and CSV export stay consistent
         dialog = ExpandedProjectionDialog(
-            self._current_data,
+            self._current_data.copy(),
             self._current_stats,
             "X Projection",
             "horizontal",
@@ -520,7 +555,7 @@ class YProjectionPanel(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self._visible = False
-        self._current_data: npt.NDArray[np.float64] | None = None
+        self._current_data: npt.NDArray[np.float32] | None = None
         self._current_stats: ProjectionStats | None = None
         self._current_normalized = False
         self.setMinimumWidth(130)
@@ -590,7 +625,7 @@ class YProjectionPanel(QWidget):
 
     def update_projection(
         self,
-        data: npt.NDArray[np.float64],
+        data: npt.NDArray[np.float32],
         stats: ProjectionStats,
         normalized: bool = False,
     ) -> None:
@@ -613,8 +648,10 @@ class YProjectionPanel(QWidget):
         if self._current_data is None:
             return
 
+        # The analyzer reuses the projection buffer for the next frame;
+        # snapshot it so the dialog's plot and CSV export stay consistent
         dialog = ExpandedProjectionDialog(
-            self._current_data,
+            self._current_data.copy(),
             self._current_stats,
             "Y Projection",
             "vertical",
@@ -641,7 +678,7 @@ class ExpandedProjectionDialog(QDialog):
 
     def __init__(
         self,
-        data: npt.NDArray[np.float64] | None,
+        data: npt.NDArray[np.float32] | None,
         stats: ProjectionStats | None,
         title: str,
         orientation: str,
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import cv2
 import numpy as np
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QLine, QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QImage, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QLabel, QSizePolicy
 
@@ -29,6 +30,112 @@ class OverlaySettings:
     crosshair_color: tuple[int, int, int] = (0, 255, 0)
 
 
+def _grid_positions(center: int, extent: int, spacing: int) -> list[int]:
+    """Grid line positions every spacing px out from center, within [0, extent)."""
+    right = np.arange(center, extent, spacing)
+    left = 2 * center - right[:0:-1]
+    positions: list[int] = np.concatenate((left[left >= 0], right)).tolist()
+    return positions
+
+
+@lru_cache(maxsize=16)
+def _grid_endpoints(w: int, h: int, spacing: int) -> npt.NDArray[np.int32]:
+    """Grid line endpoints as a read-only (N, 4) array of x1, y1, x2, y2 rows."""
+    xs = np.array(_grid_positions(w // 2, w, spacing), dtype=np.int32)
+    ys = np.array(_grid_positions(h // 2, h, spacing), dtype=np.int32)
+    endpoints = np.zeros((len(xs) + len(ys), 4), dtype=np.int32)
+    endpoints[: len(xs), 0] = endpoints[: len(xs), 2] = xs  # Vertical lines
+    endpoints[: len(xs), 3] = h
+    endpoints[len(xs) :, 1] = endpoints[len(xs) :, 3] = ys  # Horizontal lines
+    endpoints[len(xs) :, 2] = w
+    endpoints.flags.writeable = False  # Shared between callers via the cache
+    return endpoints
+
+
+# QImage format and bytes per pixel for each camera pixel format.
+# BGR888 wraps OpenCV's channel order directly, avoiding a BGR->RGB swap pass.
+_PIXEL_FORMATS: dict[str, tuple[QImage.Format, int]] = {
+    "mono8": (QImage.Format.Format_Grayscale8, 1),
+    "bgr8": (QImage.Format.Format_BGR888, 3),
+}
+
+# The same entries by channel count, for frames that don't match the format
+_FORMATS_BY_CHANNELS = {entry[1]: entry for entry in _PIXEL_FORMATS.values()}
+
+
+def _fit_frame(
+    frame: npt.NDArray[np.uint8],
+    display_w: int,
+    display_h: int,
+    image_format: tuple[QImage.Format, int],
+) -> tuple[QImage, npt.NDArray[Any]]:
+    """Resize frame to fit the display and wrap it in a QImage.
+
+    Safe to call off the GUI thread.
+
+    Args:
+        frame: Camera frame matching image_format.
+        display_w: Available display width.
+        display_h: Available display height.
+        image_format: Entry of _PIXEL_FORMATS for the camera's pixel format.
+
+    Returns:
+        Tuple of (image, resized) where resized backs the zero-copy image and
+        must be kept alive as long as the image is in use.
+    """
+    # Resize frame to fit display
+    h, w = frame.shape[:2]
+    scale = min(display_w / w, display_h / h)
+    new_w, new_h = int(w * scale), int(h * scale)
+    resized: npt.NDArray[Any]
+    if (new_w, new_h) == (w, h):
+        # Frame already fits exactly, skip the resize copy
+        resized = np.ascontiguousarray(frame)
+    else:
+        # Area averaging is faster and alias-free when shrinking
+        interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        resized = cv2.resize(frame, (new_w, new_h), interpolation=interp)
+
+    # Wrap the pixel data directly in the format chosen at connect time
+    h, w = resized.shape[:2]
+    fmt, bytes_per_pixel = image_format
+    return QImage(resized.data, w, h, bytes_per_pixel * w, fmt), resized
+
+
+class _FrameSignals(QObject):
+    """Signals used by _ResizeTask to hand results back to the GUI thread."""
+
+    # (image, resized buffer, base key)
+    frame_ready = Signal(object, object, object)
+
+
+class _ResizeTask(QRunnable):
+    """Thread pool job that resizes one frame for display."""
+
+    def __init__(
+        self,
+        signals: _FrameSignals,
+        frame: npt.NDArray[np.uint8],
+        key: tuple[int, int, int],
+        image_format: tuple[QImage.Format, int],
+    ) -> None:
+        super().__init__()
+        self._signals = signals
+        self._frame = frame
+        self._key = key
+        self._image_format = image_format
+
+    def run(self) -> None:
+        _, display_w, display_h = self._key
+        image, resized = _fit_frame(
+            self._frame, display_w, display_h, self._image_format
+        )
+        try:
+            self._signals.frame_ready.emit(image, resized, self._key)
+        except RuntimeError:
+            pass  # Viewport was destroyed while the job was running
+
+
 class CameraViewport(QLabel):
     """Widget that displays camera frames with optional overlays."""
 
@@ -37,7 +144,39 @@ class CameraViewport(QLabel):
         self._display_width = width
         self._display_height = height
         self._overlay = OverlaySettings()
+        self._image_format = _PIXEL_FORMATS["mono8"]
         self._current_frame: npt.NDArray[np.uint8] | None = None
+        # Increases with every frame; ids of freed arrays can be reused
+        self._frame_seq = 0
+
+        # Backing buffer of the last zero-copy QImage
+        self._last_resized: npt.NDArray[Any] | None = None
+
+        # Resized frame reused while only overlays change
+        self._base_image: QImage | None = None
+        self._base_key: tuple[int, int, int] | None = None
+
+        # Display buffers reused across frames, recreated only on resize.
+        # Frames are composited into the back buffer (_pixmap_b) and the two
+        # are swapped, so the label never shares the pixmap being painted.
+        self._pixmap_a: QPixmap | None = None
+        self._pixmap_b: QPixmap | None = None
+
+        # Pre-rendered overlays, rebuilt only when size or settings change
+        self._overlay_cache: QPixmap | None = None
+        self._overlay_cache_key: tuple[object, ...] | None = None
+
+        # Coalesce overlay setter calls into one re-render per event-loop tick
+        self._render_pending = False
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._flush_render)
+
+        # Resize new frames off the GUI thread, one job in flight at a time
+        self._pool = QThreadPool.globalInstance()
+        self._signals = _FrameSignals(self)
+        self._signals.frame_ready.connect(self._on_frame_ready)
+        self._resize_in_flight = False
 
         self.setMinimumSize(320, 240)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -55,41 +194,58 @@ class CameraViewport(QLabel):
             "color: #666; font-size: 24px;"
         )
 
+    def set_pixel_format(self, pixel_format: str) -> None:
+        """Set the layout of incoming frames, "mono8" or "bgr8".
+
+        Call once when a camera connects so frames are wrapped without
+        inspecting their shape every time.
+        """
+        if pixel_format not in _PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format: {pixel_format}")
+        self._image_format = _PIXEL_FORMATS[pixel_format]
+        self._base_key = None  # Cached frame was wrapped in the old format
+
     def set_overlay_settings(self, settings: OverlaySettings) -> None:
         """Update overlay settings."""
         self._overlay = settings
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_show_grid(self, show: bool) -> None:
         self._overlay.show_grid = show
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_show_crosshair(self, show: bool) -> None:
         self._overlay.show_crosshair = show
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_grid_spacing(self, spacing: int) -> None:
         self._overlay.grid_spacing = spacing
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_crosshair_size(self, size: int) -> None:
         self._overlay.crosshair_size = size
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_crosshair_extend(self, extend: bool) -> None:
         """Set whether crosshair extends to image edges."""
         self._overlay.crosshair_extend = extend
-        if self._current_frame is not None:
-            self._render_frame(self._current_frame)
+        self._schedule_render()
 
     def set_crosshair_width(self, width: int) -> None:
         """Set crosshair line width in pixels."""
         self._overlay.crosshair_width = width
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        """Request a re-render of the current frame on the next event loop."""
+        self._render_pending = True
+        self._update_timer.start(0)
+
+    def _flush_render(self) -> None:
+        """Re-render the current frame once for all pending overlay changes."""
+        if not self._render_pending:
+            return
+        self._render_pending = False
         if self._current_frame is not None:
             self._render_frame(self._current_frame)
 
@@ -99,52 +255,138 @@ class CameraViewport(QLabel):
             self._show_placeholder()
             return
 
+        # A frame that doesn't match the configured format (e.g. the camera
+        # switched formats) would make QImage read past the end of its buffer
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+        if channels != self._image_format[1]:
+            image_format = _FORMATS_BY_CHANNELS.get(channels)
+            if image_format is None:
+                return  # Unsupported layout, drop the frame
+            self._image_format = image_format
+            self._base_key = None
+
         self._current_frame = frame
-        self._render_frame(frame)
+        self._frame_seq += 1
+        self._render_pending = False  # New frame renders current overlays
+
+        # Drop intermediate frames while a resize is running; the latest
+        # frame is picked up when the job finishes.
+        if not self._resize_in_flight:
+            self._start_resize(frame)
+
+    def _display_key(self) -> tuple[int, int, int]:
+        """Cache key for the current frame resized to the current widget size."""
+        # Use actual widget size for scaling (respects layout constraints)
+        return (self._frame_seq, max(self.width(), 320), max(self.height(), 240))
+
+    def _start_resize(self, frame: npt.NDArray[np.uint8]) -> None:
+        """Queue frame for resizing on the thread pool."""
+        self._resize_in_flight = True
+        key = self._display_key()
+        self._pool.start(_ResizeTask(self._signals, frame, key, self._image_format))
+
+    def _on_frame_ready(
+        self, image: QImage, resized: npt.NDArray[Any], key: tuple[int, int, int]
+    ) -> None:
+        """Display a frame resized by the thread pool."""
+        self._resize_in_flight = False
+        frame = self._current_frame
+        if frame is None:
+            return  # Cleared while the job was running
+
+        if key == self._display_key():
+            # Keep the buffer alive for the zero-copy QImage
+            self._last_resized = resized
+            self._base_image = image
+            self._base_key = key
+            self._render_frame(frame)
+        else:
+            # A newer frame arrived or the widget was resized meanwhile
+            self._start_resize(frame)
 
     def clear_frame(self) -> None:
         """Clear current frame and free memory."""
         self._current_frame = None
+        self._last_resized = None
+        self._base_image = None
+        self._base_key = None
+        self._pixmap_a = None
+        self._pixmap_b = None
         self._show_placeholder()
 
     def _render_frame(self, frame: npt.NDArray[np.uint8]) -> None:
-        """Render grayscale frame with overlays."""
-        # Use actual widget size for scaling (respects layout constraints)
-        display_w = max(self.width(), 320)
-        display_h = max(self.height(), 240)
-
-        # Resize frame to fit display
-        h, w = frame.shape[:2]
-        scale = min(display_w / w, display_h / h)
-        new_w, new_h = int(w * scale), int(h * scale)
-        resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-
-        # Ensure contiguous memory for QImage
-        resized = np.ascontiguousarray(resized)
-
-        # Create QImage directly from grayscale data
-        h, w = resized.shape
-        bytes_per_line = w
-
-        # Create QImage with copy of data (prevents memory issues)
-        image = QImage(
-            resized.data, w, h, bytes_per_line, QImage.Format.Format_Grayscale8
-        ).copy()
-        pixmap = QPixmap.fromImage(image)
-
-        # Draw overlays
+        """Render frame with overlays."""
+        # Overlay-only changes reuse the resized frame
+        key = self._display_key()
+        if self._base_image is None or key != self._base_key:
+            _, display_w, display_h = key
+            self._base_image = self._frame_to_image(frame, display_w, display_h)
+            self._base_key = key
+        image = self._base_image
+
+        pixmap = self._back_buffer(image.width(), image.height())
+        painter = QPainter(pixmap)
+        painter.drawImage(0, 0, image)
+        painter.end()
         if self._overlay.show_grid or self._overlay.show_crosshair:
-            pixmap = self._draw_overlays(pixmap)
+            self._draw_overlays(pixmap)
 
         self.setPixmap(pixmap)
+        self._pixmap_a, self._pixmap_b = pixmap, self._pixmap_a
+
+    def _back_buffer(self, w: int, h: int) -> QPixmap:
+        """Get the pixmap not currently on screen, sized w x h."""
+        for buffer in (self._pixmap_a, self._pixmap_b):
+            if buffer is not None and (buffer.width(), buffer.height()) != (w, h):
+                self._pixmap_a = self._pixmap_b = None
+                break
+        if self._pixmap_b is None:
+            self._pixmap_b = QPixmap(w, h)
+        return self._pixmap_b
+
+    def _frame_to_image(
+        self, frame: npt.NDArray[np.uint8], display_w: int, display_h: int
+    ) -> QImage:
+        """Resize frame on the GUI thread and wrap it in a QImage."""
+        image, resized = _fit_frame(frame, display_w, display_h, self._image_format)
+        # Keep the buffer alive for the zero-copy QImage
+        self._last_resized = resized
+        return image
 
     def _draw_overlays(self, pixmap: QPixmap) -> QPixmap:
-        """Draw grid and crosshair overlays on pixmap."""
-        result = QPixmap(pixmap)
-        painter = QPainter(result)
+        """Composite the cached grid and crosshair overlay onto pixmap in place."""
+        overlay = self._overlay_pixmap(pixmap.width(), pixmap.height())
+        painter = QPainter(pixmap)
+        painter.drawPixmap(0, 0, overlay)
+        painter.end()
+        return pixmap
+
+    def _overlay_pixmap(self, w: int, h: int) -> QPixmap:
+        """Get a transparent pixmap with the overlays drawn, rebuilt on change."""
+        o = self._overlay
+        key = (
+            w,
+            h,
+            o.show_grid,
+            o.show_crosshair,
+            o.grid_spacing,
+            o.crosshair_size,
+            o.crosshair_extend,
+            o.crosshair_width,
+            o.grid_color,
+        )
+        if self._overlay_cache is None or key != self._overlay_cache_key:
+            self._overlay_cache = QPixmap(w, h)
+            self._overlay_cache.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self._overlay_cache)
+            self._paint_overlays(painter, w, h)
+            painter.end()
+            self._overlay_cache_key = key
+        return self._overlay_cache
+
+    def _paint_overlays(self, painter: QPainter, w: int, h: int) -> None:
+        """Draw grid and crosshair overlays with painter."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        w, h = result.width(), result.height()
         cx, cy = w // 2, h // 2
 
         # Draw grid
@@ -158,23 +400,9 @@ class CameraViewport(QLabel):
             grid_pen.setStyle(Qt.PenStyle.DotLine)
             painter.setPen(grid_pen)
 
-            spacing = self._overlay.grid_spacing
-
-            # Vertical lines
-            x = cx
-            while x < w:
-                painter.drawLine(x, 0, x, h)
-                if cx - (x - cx) >= 0:
-                    painter.drawLine(cx - (x - cx), 0, cx - (x - cx), h)
-                x += spacing
-
-            # Horizontal lines
-            y = cy
-            while y < h:
-                painter.drawLine(0, y, w, y)
-                if cy - (y - cy) >= 0:
-                    painter.drawLine(0, cy - (y - cy), w, cy - (y - cy))
-                y += spacing
+            # All grid lines in a single Qt call
+            endpoints = _grid_endpoints(w, h, self._overlay.grid_spacing)
+            painter.drawLines([QLine(*row) for row in endpoints.tolist()])
 
         # Draw crosshair
         if self._overlay.show_crosshair:
@@ -195,9 +423,6 @@ class CameraViewport(QLabel):
             # Center circle
             painter.drawEllipse(cx - 5, cy - 5, 10, 10)
 
-        painter.end()
-        return result
-
     def get_current_frame(self) -> npt.NDArray[np.uint8] | None:
         """Get the current frame for analysis."""
         return self._current_frame
@@ -3,6 +3,7 @@
 import numpy as np
 
 from camera.mock import MockCamera
+from camera.spinnaker import _copy_frame
 
 
 def test_mock_camera_connect() -> None:
@@ -28,6 +29,7 @@ def test_mock_camera_acquisition() -> None:
     assert frame is not None
     assert isinstance(frame, np.ndarray)
     assert frame.shape == (480, 640)  # Grayscale
+    assert camera.pixel_format == "mono8"
     assert frame.dtype == np.uint8
 
     camera.stop_acquisition()
@@ -45,3 +47,46 @@ def test_mock_camera_settings() -> None:
     camera.set_fps(60)
 
     camera.disconnect()
+
+
+class _FakeImage:
+    """Stand-in for a PySpin ImagePtr backed by a NumPy buffer."""
+
+    def __init__(self, pixels: np.ndarray, row_padding: int = 0) -> None:
+        self._pixels = pixels
+        rows = pixels.reshape(pixels.shape[0], -1).view(np.uint8)
+        padding = np.zeros((rows.shape[0], row_padding), dtype=np.uint8)
+        self._buffer = np.hstack([rows, padding])
+
+    def GetData(self) -> np.ndarray:
+        return self._buffer.ravel()
+
+    def GetWidth(self) -> int:
+        return self._pixels.shape[1]
+
+    def GetHeight(self) -> int:
+        return self._pixels.shape[0]
+
+    def GetNumChannels(self) -> int:
+        return 1 if self._pixels.ndim == 2 else self._pixels.shape[2]
+
+    def GetBitsPerPixel(self) -> int:
+        return self.GetNumChannels() * self._pixels.itemsize * 8
+
+    def GetStride(self) -> int:
+        return self._buffer.shape[1]
+
+
+def test_copy_frame_owns_its_data() -> None:
+    mono = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    bgr = np.arange(36, dtype=np.uint8).reshape(3, 4, 3)
+    mono16 = np.arange(12, dtype=np.uint16).reshape(3, 4) * 4000
+
+    for pixels in (mono, bgr, mono16):
+        for row_padding in (0, 8):
+            image = _FakeImage(pixels, row_padding)
+            frame = _copy_frame(image)
+            assert frame.dtype == pixels.dtype
+            np.testing.assert_array_equal(frame, pixels)
+            assert not np.shares_memory(frame, image.GetData())
+            assert frame.flags.writeable
@@ -13,49 +13,101 @@ from core.projection import (
     calculate_projection,
     calculate_stats,
     normalize_projection,
+    to_grayscale,
 )
 
+# Seeded PCG64 frames generated once and shared read-only by the tests below
+_rng = np.random.default_rng(0)
+_FRAME_GRAY = _rng.integers(0, 256, (480, 640), dtype=np.uint8)
+_FRAME_BGR = _rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+_FRAME_GRAY.flags.writeable = False
+_FRAME_BGR.flags.writeable = False
 
-class TestProjectionMode:
-    """Tests for projection calculation modes."""
+# Parameters of the gaussian_100 fixture profile
+_GAUSS_CENTER = 50
+_GAUSS_SIGMA = 10.0
 
-    def test_average_mode(self) -> None:
-        """Test average projection mode."""
-        img = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
-        result = calculate_projection(img, axis=0, mode=ProjectionMode.AVERAGE)
-        expected = np.array([4.0, 5.0, 6.0])
-        np.testing.assert_array_almost_equal(result, expected)
 
-    def test_sum_mode(self) -> None:
-        """Test sum projection mode."""
-        img = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
-        result = calculate_projection(img, axis=0, mode=ProjectionMode.SUM)
-        expected = np.array([12.0, 15.0, 18.0])
-        np.testing.assert_array_almost_equal(result, expected)
+@pytest.fixture(scope="module")
+def gaussian_100() -> np.ndarray:
+    """Unit-height Gaussian over 100 samples, built once and shared read-only."""
+    x = np.arange(100)
+    profile = np.exp(-0.5 * ((x - _GAUSS_CENTER) / _GAUSS_SIGMA) ** 2)
+    profile = profile.astype(np.float32)
+    profile.flags.writeable = False
+    return profile
 
-    def test_min_mode(self) -> None:
-        """Test minimum projection mode."""
-        img = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
-        result = calculate_projection(img, axis=0, mode=ProjectionMode.MIN)
-        expected = np.array([1.0, 2.0, 3.0])
-        np.testing.assert_array_almost_equal(result, expected)
 
-    def test_max_mode(self) -> None:
-        """Test maximum projection mode."""
-        img = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
-        result = calculate_projection(img, axis=0, mode=ProjectionMode.MAX)
-        expected = np.array([7.0, 8.0, 9.0])
+class TestProjectionMode:
+    """Tests for projection calculation modes."""
+
+    IMG = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            (ProjectionMode.AVERAGE, [4.0, 5.0, 6.0]),
+            (ProjectionMode.SUM, [12.0, 15.0, 18.0]),
+            (ProjectionMode.MIN, [1.0, 2.0, 3.0]),
+            (ProjectionMode.MAX, [7.0, 8.0, 9.0]),
+        ],
+    )
+    def test_mode(self, mode: ProjectionMode, expected: list[float]) -> None:
+        """Test each projection mode on a known image."""
+        result = calculate_projection(self.IMG, axis=0, mode=mode)
         np.testing.assert_array_almost_equal(result, expected)
 
     def test_projection_axis_x(self) -> None:
         """Test X projection (axis=0) produces correct shape."""
-        img = np.random.rand(480, 640)
+        img = _rng.random((480, 640))
         result = calculate_projection(img, axis=0, mode=ProjectionMode.AVERAGE)
         assert result.shape == (640,)
 
+    def test_projection_uint8_is_float32(self) -> None:
+        """Test uint8 frames project straight to float32 without upcasting."""
+        img = _rng.integers(0, 256, (480, 640), dtype=np.uint8)
+        for axis in (0, 1):
+            result = calculate_projection(img, axis=axis, mode=ProjectionMode.AVERAGE)
+            assert result.dtype == np.float32
+            np.testing.assert_allclose(result, img.mean(axis=axis), rtol=1e-5)
+
+    def test_projection_into_out(self) -> None:
+        """Test every mode writes into a preallocated out array."""
+        img = _rng.integers(0, 256, (48, 64), dtype=np.uint8)
+        out = np.empty(48, dtype=np.float32)
+        for mode in ProjectionMode:
+            result = calculate_projection(img, axis=1, mode=mode, out=out)
+            assert result is out
+        np.testing.assert_allclose(out, img.mean(axis=1), rtol=1e-5)
+
+    def test_sum_tall_image_exact(self) -> None:
+        """Test column sums of a tall uint8 image are exact in float32."""
+        img = np.full((4000, 64), 255, dtype=np.uint8)
+        img[::2, ::3] = 1
+        result = calculate_projection(img, axis=0, mode=ProjectionMode.SUM)
+        np.testing.assert_array_equal(result, img.sum(axis=0, dtype=np.int64))
+
+    def test_projection_dtype(self) -> None:
+        """Test the accumulator dtype can be widened."""
+        img = _rng.integers(0, 256, (48, 64), dtype=np.uint8)
+        result = calculate_projection(
+            img, axis=0, mode=ProjectionMode.SUM, dtype=np.uint32
+        )
+        assert result.dtype == np.uint32
+        np.testing.assert_array_equal(result, img.sum(axis=0))
+
+    def test_average_integer_dtype(self) -> None:
+        """Test AVERAGE with an integer accumulator gives the floor mean."""
+        img = _rng.integers(0, 256, (48, 64), dtype=np.uint8)
+        result = calculate_projection(
+            img, axis=0, mode=ProjectionMode.AVERAGE, dtype=np.uint32
+        )
+        assert result.dtype == np.uint32
+        np.testing.assert_array_equal(result, img.sum(axis=0) // 48)
+
     def test_projection_axis_y(self) -> None:
         """Test Y projection (axis=1) produces correct shape."""
-        img = np.random.rand(480, 640)
+        img = _rng.random((480, 640))
         result = calculate_projection(img, axis=1, mode=ProjectionMode.AVERAGE)
         assert result.shape == (480,)
 
@@ -77,9 +129,16 @@ class TestNormalization:
         result = normalize_projection(data)
         np.testing.assert_array_equal(result, data)
 
+    def test_normalize_in_place(self) -> None:
+        """Test normalization can write back into its input buffer."""
+        data = np.array([0.0, 2.0, 4.0, 8.0], dtype=np.float32)
+        result = normalize_projection(data, out=data)
+        assert result is data
+        np.testing.assert_array_equal(data, [0.0, 0.25, 0.5, 1.0])
+
     def test_normalize_preserves_shape(self) -> None:
         """Test that normalization preserves array shape."""
-        data = np.random.rand(1920)
+        data = _rng.random(1920)
         result = normalize_projection(data)
         assert result.shape == data.shape
 
@@ -87,28 +146,21 @@ class TestNormalization:
 class TestFWHM:
     """Tests for FWHM calculation."""
 
-    def test_fwhm_gaussian(self) -> None:
+    def test_fwhm_gaussian(self, gaussian_100: np.ndarray) -> None:
         """Test FWHM on a known Gaussian profile."""
-        # Create Gaussian with known FWHM
+        # Gaussian with known FWHM
         # FWHM = 2 * sqrt(2 * ln(2)) * sigma ≈ 2.355 * sigma
-        sigma = 10.0
-        x = np.arange(100)
-        center = 50
-        gaussian = np.exp(-0.5 * ((x - center) / sigma) ** 2)
+        fwhm, left, right = calculate_fwhm(gaussian_100)
 
-        fwhm, left, right = calculate_fwhm(gaussian)
-
-        expected_fwhm = 2.355 * sigma
+        expected_fwhm = 2.355 * _GAUSS_SIGMA
         assert fwhm is not None
         assert abs(fwhm - expected_fwhm) < 0.5  # Within 0.5 pixels
 
-    def test_fwhm_symmetric(self) -> None:
+    def test_fwhm_symmetric(self, gaussian_100: np.ndarray) -> None:
         """Test that FWHM is symmetric around peak."""
-        x = np.arange(100)
-        center = 50
-        profile = np.exp(-0.5 * ((x - center) / 10) ** 2)
+        center = _GAUSS_CENTER
 
-        fwhm, left, right = calculate_fwhm(profile)
+        fwhm, left, right = calculate_fwhm(gaussian_100)
 
         assert left is not None and right is not None
         # Check symmetry
@@ -121,6 +173,15 @@ class TestFWHM:
         # Flat profile has no meaningful FWHM
         assert fwhm is None or fwhm == 0
 
+    def test_fwhm_nearest_crossings(self) -> None:
+        """Test crossings are the ones nearest the peak, not side lobes."""
+        data = np.array([0.0, 9.0, 0.0, 2.0, 6.0, 10.0, 6.0, 2.0, 0.0])
+        fwhm, left, right = calculate_fwhm(data)
+        # Half maximum 5.0 crosses between samples 3-4 and 6-7
+        assert left == pytest.approx(3.75)
+        assert right == pytest.approx(6.25)
+        assert fwhm == pytest.approx(2.5)
+
     def test_fwhm_short_array(self) -> None:
         """Test FWHM with too-short array."""
         data = np.array([1.0, 2.0])
@@ -149,10 +210,38 @@ class TestProjectionStats:
         assert stats.peak_pos == 4
         assert abs(stats.std - np.std(data)) < 0.001
 
-    def test_stats_gaussian(self) -> None:
+    def test_stats_match_numpy_float32(self) -> None:
+        """Test single-pass stats agree with NumPy on float32 projections."""
+        data = (_rng.random(1920) * 1e5).astype(np.float32)
+        stats = calculate_stats(data)
+
+        assert stats.peak_pos == int(np.argmax(data))
+        assert stats.min_val == float(data.min())
+        assert stats.max_val == float(data.max())
+        assert stats.mean == pytest.approx(float(data.mean()), rel=1e-5)
+        assert stats.std == pytest.approx(float(data.std()), rel=1e-4)
+
+    def test_stats_float16(self) -> None:
+        """Test dtypes OpenCV cannot reduce are still supported."""
+        data = (1 - np.abs(np.linspace(-1, 1, 51))).astype(np.float16)
+        stats = calculate_stats(data)
+
+        assert stats.peak_pos == 25
+        assert stats.min_val == 0.0
+        assert stats.max_val == 1.0
+        assert stats.mean == pytest.approx(float(data.astype(np.float64).mean()))
+        assert stats.std == pytest.approx(float(data.astype(np.float64).std()))
+        assert stats.fwhm == pytest.approx(25.0)
+
+    def test_stats_immutable(self) -> None:
+        """Test stats are frozen, so cached results cannot be altered."""
+        stats = calculate_stats(np.array([1.0, 2.0, 3.0]))
+        with pytest.raises(AttributeError):
+            stats.mean = 0.0  # type: ignore[misc]
+
+    def test_stats_gaussian(self, gaussian_100: np.ndarray) -> None:
         """Test statistics on Gaussian profile."""
-        x = np.arange(100)
-        data = 100.0 * np.exp(-0.5 * ((x - 50) / 10) ** 2)
+        data = 100.0 * gaussian_100
         stats = calculate_stats(data)
 
         assert stats.peak_pos == 50
@@ -161,6 +250,22 @@ class TestProjectionStats:
         assert stats.fwhm > 0
 
 
+class TestGrayscale:
+    """Tests for shared grayscale conversion."""
+
+    def test_grayscale_passthrough(self) -> None:
+        """Test single-channel frames are returned without a copy."""
+        frame = _rng.integers(0, 256, (48, 64), dtype=np.uint8)
+        assert to_grayscale(frame) is frame
+
+    def test_grayscale_from_bgr(self) -> None:
+        """Test BGR frames are reduced to a single uint8 channel."""
+        frame = _rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+        gray = to_grayscale(frame)
+        assert gray.shape == (48, 64)
+        assert gray.dtype == np.uint8
+
+
 class TestProjectionAnalyzer:
     """Tests for ProjectionAnalyzer class."""
 
@@ -175,12 +280,17 @@ class TestProjectionAnalyzer:
         analyzer = ProjectionAnalyzer(mode=ProjectionMode.SUM)
         assert analyzer.mode == ProjectionMode.SUM
 
+    def test_analyzer_mode_switch(self) -> None:
+        """Test assigning mode takes effect on the next analysis."""
+        analyzer = ProjectionAnalyzer()
+        analyzer.mode = ProjectionMode.MAX
+        data, _ = analyzer.analyze_y(_FRAME_GRAY)
+        np.testing.assert_array_equal(data, _FRAME_GRAY.max(axis=1))
+
     def test_analyze_x_grayscale(self) -> None:
         """Test X analysis on grayscale image."""
         analyzer = ProjectionAnalyzer()
-        frame = np.random.randint(0, 256, (480, 640), dtype=np.uint8)
-
-        data, stats = analyzer.analyze_x(frame)
+        data, stats = analyzer.analyze_x(_FRAME_GRAY)
 
         assert data.shape == (640,)
         assert isinstance(stats, ProjectionStats)
@@ -188,9 +298,7 @@ class TestProjectionAnalyzer:
     def test_analyze_y_grayscale(self) -> None:
         """Test Y analysis on grayscale image."""
         analyzer = ProjectionAnalyzer()
-        frame = np.random.randint(0, 256, (480, 640), dtype=np.uint8)
-
-        data, stats = analyzer.analyze_y(frame)
+        data, stats = analyzer.analyze_y(_FRAME_GRAY)
 
         assert data.shape == (480,)
         assert isinstance(stats, ProjectionStats)
@@ -198,24 +306,84 @@ class TestProjectionAnalyzer:
     def test_analyze_x_color(self) -> None:
         """Test X analysis on color (BGR) image."""
         analyzer = ProjectionAnalyzer()
-        frame = np.random.randint(0, 256, (480, 640, 3), dtype=np.uint8)
-
-        data, stats = analyzer.analyze_x(frame)
+        data, stats = analyzer.analyze_x(_FRAME_BGR)
 
         assert data.shape == (640,)
 
+    def test_analyze_color_uses_luminance(self) -> None:
+        """Test BGR frames are converted with luminance weights, not one channel."""
+        analyzer = ProjectionAnalyzer()
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        frame[:, :] = (100, 150, 200)  # B, G, R
+
+        data, _ = analyzer.analyze_x(frame)
+
+        # 0.114 * B + 0.587 * G + 0.299 * R = 159.25
+        np.testing.assert_allclose(data, 159.0, atol=1.0)
+
     def test_analyze_with_normalization(self) -> None:
         """Test analysis with normalization enabled."""
         analyzer = ProjectionAnalyzer(normalize=True)
-        frame = np.random.randint(0, 256, (100, 100), dtype=np.uint8)
+        frame = _rng.integers(0, 256, (100, 100), dtype=np.uint8)
 
         data, stats = analyzer.analyze_x(frame)
 
         assert data.max() == pytest.approx(1.0)
 
+    def test_normalized_stats_match_normalized_data(self) -> None:
+        """Test rescaled stats agree with stats recomputed on normalized data."""
+        x = np.arange(200)
+        profile = 50 + 150 * np.exp(-0.5 * ((x - 80) / 12) ** 2)
+        frame = np.tile(profile, (40, 1)).astype(np.uint8)
+
+        data, stats = ProjectionAnalyzer(normalize=True).analyze_x(frame)
+        expected = calculate_stats(data)
+
+        assert stats.max_val == 1.0
+        assert stats.peak_pos == expected.peak_pos
+        assert stats.mean == pytest.approx(expected.mean, rel=1e-5)
+        assert stats.std == pytest.approx(expected.std, rel=1e-5)
+        assert stats.min_val == pytest.approx(expected.min_val, rel=1e-5)
+        assert stats.fwhm == pytest.approx(expected.fwhm, rel=1e-5)
+
+    def test_analyzer_reuses_buffer(self) -> None:
+        """Test each axis keeps one projection buffer across frames."""
+        analyzer = ProjectionAnalyzer()
+        frame = _rng.integers(0, 256, (48, 64), dtype=np.uint8)
+
+        first, _ = analyzer.analyze_x(frame)
+        second, _ = analyzer.analyze_x(frame)
+        y_data, _ = analyzer.analyze_y(frame)
+
+        assert second is first
+        assert y_data is not first
+        assert analyzer.analyze_x(frame[:, :32])[0].shape == (32,)
+
+    def test_analyze_batch_matches_single(self) -> None:
+        """Test batch analysis of ROIs matches analyzing them one by one."""
+        analyzer = ProjectionAnalyzer(normalize=True)
+        rois = [_FRAME_GRAY[:240], _FRAME_GRAY[240:], _FRAME_BGR[:, :320]]
+        axes = [0, 1, 0]
+
+        results = analyzer.analyze_batch(rois, axes)
+
+        assert len(results) == 3
+        single = ProjectionAnalyzer(normalize=True)
+        for (data, stats), roi, axis in zip(results, rois, axes, strict=True):
+            analyze = single.analyze_x if axis == 0 else single.analyze_y
+            expected, expected_stats = analyze(roi)
+            np.testing.assert_array_equal(data, expected)
+            assert stats == expected_stats
+        assert results[0][0] is not results[2][0]
+
+    def test_analyze_batch_length_mismatch(self) -> None:
+        """Test mismatched frames and axes are rejected."""
+        with pytest.raises(ValueError):
+            ProjectionAnalyzer().analyze_batch([_FRAME_GRAY], [0, 1])
+
     def test_analyze_mode_affects_result(self) -> None:
         """Test that different modes produce different results."""
-        frame = np.random.randint(0, 256, (100, 100), dtype=np.uint8)
+        frame = _FRAME_GRAY
 
         avg_analyzer = ProjectionAnalyzer(mode=ProjectionMode.AVERAGE)
         sum_analyzer = ProjectionAnalyzer(mode=ProjectionMode.SUM)
@@ -223,5 +391,5 @@ class TestProjectionAnalyzer:
         avg_data, _ = avg_analyzer.analyze_x(frame)
         sum_data, _ = sum_analyzer.analyze_x(frame)
 
-        # Sum should be 100x average (height of image)
-        np.testing.assert_array_almost_equal(sum_data, avg_data * 100)
+        # Sum should be 480x average (height of image), to float32 precision
+        np.testing.assert_allclose(sum_data, avg_data * 480, rtol=1e-5)
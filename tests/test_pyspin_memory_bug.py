@@ -63,11 +63,13 @@ class _PyArrayObject(ctypes.Structure):
 
 _NPY_ARRAY_OWNDATA = 0x0004
 
+# Byte offset of the flags field, so each call touches only that int
+_FLAGS_OFFSET = _PyArrayObject.flags.offset
+
 
 def clear_owndata_flag(arr: np.ndarray) -> None:  # type: ignore[type-arg]
     """Clear OWNDATA flag to prevent numpy from freeing PySpin memory."""
-    arr_struct = _PyArrayObject.from_address(id(arr))
-    arr_struct.flags &= ~_NPY_ARRAY_OWNDATA
+    ctypes.c_int.from_address(id(arr) + _FLAGS_OFFSET).value &= ~_NPY_ARRAY_OWNDATA
 
 
 # ============================================================================
@@ -192,8 +194,11 @@ def test_workaround_clear_owndata() -> None:
 
     cam.BeginAcquisition()
 
-    frames = []
-    for i in range(10):
+    num_frames = 10
+    # Contiguous (N, H, W) capture buffer, sized from the first valid frame
+    frames: np.ndarray | None = None  # type: ignore[type-arg]
+    count = 0
+    for i in range(num_frames):
         img = cam.GetNextImage(2000)
         if img.IsIncomplete():
             img.Release()
@@ -204,9 +209,12 @@ def test_workaround_clear_owndata() -> None:
         # WORKAROUND: Clear OWNDATA flag BEFORE any copy operation
         clear_owndata_flag(raw)
 
-        # Now we can safely copy
-        frame = np.array(raw, copy=True)
-        frames.append(frame)
+        # Now we can safely copy, into a buffer allocated once up front
+        if frames is None:
+            frames = np.empty((num_frames, *raw.shape), dtype=raw.dtype)
+        frame = frames[count]
+        np.copyto(frame, raw, casting="no")
+        count += 1
         print(f"  Frame {i}: {frame.shape}, mean={frame.mean():.1f}")
 
         img.Release()
@@ -217,7 +225,7 @@ def test_workaround_clear_owndata() -> None:
     cam_list.Clear()
     system.ReleaseInstance()
 
-    print(f"  PASS: Captured {len(frames)} frames without crash")
+    print(f"  PASS: Captured {count} frames without crash")
 
 
 if __name__ == "__main__":
@@ -15,6 +15,14 @@ try:
 except ImportError:
     PYSPIN_AVAILABLE = False
 
+# Our wrapper, imported once for TestSpinnakerCameraWrapper
+try:
+    from camera.spinnaker import SPINNAKER_AVAILABLE as _SPIN_WRAP
+    from camera.spinnaker import SpinnakerCamera
+except ImportError:
+    SpinnakerCamera = None
+    _SPIN_WRAP = False
+
 
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
@@ -29,9 +37,9 @@ pytestmark = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spinnaker_system():
-    """Fixture to get Spinnaker system instance."""
+    """Fixture to get the Spinnaker system instance, shared by the session."""
     system = PySpin.System.GetInstance()
     yield system
     system.ReleaseInstance()
@@ -45,6 +53,52 @@ def camera_list(spinnaker_system):
     cam_list.Clear()
 
 
+@pytest.fixture(scope="session")
+def _camera_count(spinnaker_system) -> int:
+    """Fixture to count connected cameras once per session."""
+    cam_list = spinnaker_system.GetCameras()
+    count = cam_list.GetSize()
+    cam_list.Clear()
+    return count
+
+
+@pytest.fixture
+def _require_camera(_camera_count: int) -> None:
+    """Fixture to skip a test when no camera is connected."""
+    if _camera_count == 0:
+        pytest.skip("No cameras connected")
+
+
+# Mark for tests that need at least one connected camera
+requires_camera = pytest.mark.usefixtures("_require_camera")
+
+
+def _set_low_latency(cam) -> None:
+    """Keep a single stream buffer so GetNextImage returns the newest frame.
+
+    Must be called after ``cam.Init()`` and before ``BeginAcquisition()``.
+    """
+    s_nodemap = cam.GetTLStreamNodeMap()
+
+    handling_mode = PySpin.CEnumerationPtr(
+        s_nodemap.GetNode("StreamBufferHandlingMode")
+    )
+    if PySpin.IsWritable(handling_mode):
+        entry = handling_mode.GetEntryByName("NewestOnly")
+        if PySpin.IsReadable(entry):
+            handling_mode.SetIntValue(entry.GetValue())
+
+    count_mode = PySpin.CEnumerationPtr(s_nodemap.GetNode("StreamBufferCountMode"))
+    if PySpin.IsWritable(count_mode):
+        entry = count_mode.GetEntryByName("Manual")
+        if PySpin.IsReadable(entry):
+            count_mode.SetIntValue(entry.GetValue())
+
+    buffer_count = PySpin.CIntegerPtr(s_nodemap.GetNode("StreamBufferCountManual"))
+    if PySpin.IsWritable(buffer_count):
+        buffer_count.SetValue(max(1, buffer_count.GetMin()))
+
+
 class TestSpinnakerSystemBasics:
     """Test basic Spinnaker system operations."""
 
@@ -69,14 +123,12 @@ class TestSpinnakerSystemBasics:
         cam_list.Clear()
 
 
+@requires_camera
 class TestSpinnakerCameraDiscovery:
     """Test camera discovery without initialization."""
 
     def test_discover_cameras_tl_nodemap(self, camera_list) -> None:
         """Test reading camera info from TL device nodemap (no Init)."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
 
         # Get TL device nodemap (before Init)
@@ -99,14 +151,12 @@ class TestSpinnakerCameraDiscovery:
         del cam
 
 
+@requires_camera
 class TestSpinnakerCameraInit:
     """Test camera initialization and deinitialization."""
 
     def test_init_deinit_camera(self, camera_list) -> None:
         """Test initializing and deinitializing camera."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
 
         # Initialize
@@ -121,9 +171,6 @@ class TestSpinnakerCameraInit:
 
     def test_read_nodemap_after_init(self, camera_list) -> None:
         """Test reading nodemap after initialization."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
         cam.Init()
 
@@ -154,26 +201,29 @@ class TestSpinnakerImageProcessor:
             PySpin.SPINNAKER_COLOR_PROCESSING_ALGORITHM_HQ_LINEAR
         )
 
-    def test_processor_lifecycle(self) -> None:
-        """Test processor creation and deletion."""
+    def test_processor_is_reusable(self) -> None:
+        """Test one processor can be reconfigured repeatedly.
+
+        ImageProcessor holds internal lookup tables, so it should be created
+        once and reused rather than rebuilt per frame.
+        """
+        processor = PySpin.ImageProcessor()
         for _ in range(5):
-            processor = PySpin.ImageProcessor()
             processor.SetColorProcessing(
                 PySpin.SPINNAKER_COLOR_PROCESSING_ALGORITHM_HQ_LINEAR
             )
-            del processor
+        del processor
 
 
+@requires_camera
 class TestSpinnakerAcquisition:
     """Test image acquisition."""
 
     def test_single_frame_acquisition(self, camera_list) -> None:
         """Test acquiring a single frame."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
         cam.Init()
+        _set_low_latency(cam)
 
         try:
             # Set acquisition mode
@@ -208,21 +258,16 @@ class TestSpinnakerAcquisition:
             cam.DeInit()
             del cam
 
-    def test_get_frame_with_getdata(self) -> None:
+    def test_get_frame_with_getdata(self, spinnaker_system) -> None:
         """Test getting frame using GetData() instead of GetNDArray().
 
-        This test does not use fixtures to ensure complete isolation.
+        This test manages its own camera list on the shared system instance.
         """
-        system = PySpin.System.GetInstance()
-        cam_list = system.GetCameras()
-
-        if cam_list.GetSize() == 0:
-            cam_list.Clear()
-            system.ReleaseInstance()
-            pytest.skip("No cameras connected")
+        cam_list = spinnaker_system.GetCameras()
 
         cam = cam_list.GetByIndex(0)
         cam.Init()
+        _set_low_latency(cam)
 
         try:
             # Set pixel format to Mono8 if possible
@@ -253,19 +298,15 @@ class TestSpinnakerAcquisition:
             pixel_format = image_result.GetPixelFormat()
             print(f"Image: {width}x{height}, format: {pixel_format}")
 
-            # Create an empty numpy array and copy data into it
-            frame = np.empty((height, width), dtype=np.uint8)
-            # Get size and copy directly
             buffer_size = image_result.GetBufferSize()
             print(f"Buffer size: {buffer_size}, expected: {width * height}")
 
-            # Use GetData() and manually copy
+            # Use GetData() and copy once into a NumPy-owned array
             src_data = image_result.GetData()
-            np.copyto(
-                frame,
-                np.frombuffer(src_data, dtype=np.uint8, count=width * height).reshape(
-                    (height, width)
-                ),
+            frame = (
+                np.frombuffer(src_data, dtype=np.uint8, count=width * height)
+                .reshape((height, width))
+                .copy()
             )
 
             print(f"Frame shape: {frame.shape}")
@@ -284,15 +325,12 @@ class TestSpinnakerAcquisition:
             cam.DeInit()
             del cam
             cam_list.Clear()
-            system.ReleaseInstance()
 
     def test_multiple_frames_acquisition(self, camera_list) -> None:
         """Test acquiring multiple frames in a loop."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
         cam.Init()
+        _set_low_latency(cam)
 
         try:
             nodemap = cam.GetNodeMap()
@@ -307,31 +345,39 @@ class TestSpinnakerAcquisition:
 
             cam.BeginAcquisition()
 
-            frames = []
-            for _ in range(10):
+            # Ring buffer allocated once from the first frame's dimensions
+            num_frames = 10
+            frames = None
+            count = 0
+            for _ in range(num_frames):
                 image_result = cam.GetNextImage(2000)
                 if not image_result.IsIncomplete():
                     width = image_result.GetWidth()
                     height = image_result.GetHeight()
+                    if frames is None:
+                        frames = np.empty((num_frames, height, width), dtype=np.uint8)
                     # Use GetData() for safe memory handling
                     data = image_result.GetData()
-                    frame = (
-                        np.frombuffer(data, dtype=np.uint8)
-                        .reshape((height, width))
-                        .copy()
+                    np.copyto(
+                        frames[count],
+                        np.frombuffer(
+                            data, dtype=np.uint8, count=width * height
+                        ).reshape((height, width)),
                     )
-                    frames.append(frame)
+                    count += 1
                 image_result.Release()
 
             cam.EndAcquisition()
 
-            assert len(frames) == 10
-            print(f"Acquired {len(frames)} frames")
+            assert count == num_frames
+            print(f"Acquired {count} frames")
 
-            # Verify all frames are valid
-            for i, frame in enumerate(frames):
-                assert frame.shape[0] > 0
-                print(f"Frame {i}: shape={frame.shape}, mean={np.mean(frame):.1f}")
+            # Verify all frames once the device is released, in one pass
+            acquired = frames[:count]
+            assert acquired.shape[1] > 0
+            means = acquired.mean(axis=(1, 2))
+            for i, mean in enumerate(means):
+                print(f"Frame {i}: shape={acquired.shape[1:]}, mean={mean:.1f}")
 
         finally:
             cam.DeInit()
@@ -339,11 +385,9 @@ class TestSpinnakerAcquisition:
 
     def test_image_processor_convert(self, camera_list) -> None:
         """Test using ImageProcessor to convert images."""
-        if camera_list.GetSize() == 0:
-            pytest.skip("No cameras connected")
-
         cam = camera_list.GetByIndex(0)
         cam.Init()
+        _set_low_latency(cam)
 
         # Create processor once
         processor = PySpin.ImageProcessor()
@@ -362,43 +406,73 @@ class TestSpinnakerAcquisition:
 
             cam.BeginAcquisition()
 
-            for i in range(5):
+            # Ring buffer allocated once from the first frame's dimensions
+            num_frames = 5
+            frames = None
+            count = 0
+            for _ in range(num_frames):
                 image_result = cam.GetNextImage(2000)
                 if not image_result.IsIncomplete():
                     width = image_result.GetWidth()
                     height = image_result.GetHeight()
+                    if frames is None:
+                        frames = np.empty(
+                            (num_frames, height, width, 3), dtype=np.uint8
+                        )
                     # Convert to BGR8
                     converted = processor.Convert(image_result, PySpin.PixelFormat_BGR8)
 
                     # Use GetData() for safe memory handling
                     data = converted.GetData()
-                    frame = (
-                        np.frombuffer(data, dtype=np.uint8)
-                        .reshape((height, width, 3))
-                        .copy()
+                    np.copyto(
+                        frames[count],
+                        np.frombuffer(
+                            data, dtype=np.uint8, count=width * height * 3
+                        ).reshape((height, width, 3)),
                     )
-                    print(f"Frame {i}: shape={frame.shape}")
-
-                    assert len(frame.shape) == 3
-                    assert frame.shape[2] == 3  # BGR
+                    count += 1
 
                 image_result.Release()
 
             cam.EndAcquisition()
 
+            # Converted frames stay valid after their images are released
+            assert count > 0
+            converted_frames = frames[:count]
+            print(f"Converted {count} frames: shape={converted_frames.shape[1:]}")
+            assert converted_frames.shape[1:] == (height, width, 3)  # BGR
+            assert converted_frames.dtype == np.uint8
+            assert converted_frames.any()
+
         finally:
             cam.DeInit()
             del cam
 
 
+@pytest.fixture(scope="class")
+def connected_camera():
+    """Fixture to connect one SpinnakerCamera for a whole test class."""
+    if not _SPIN_WRAP:
+        pytest.skip("Spinnaker not available")
+
+    camera = SpinnakerCamera()
+    try:
+        camera.connect()
+    except RuntimeError as e:
+        if "No cameras" in str(e):
+            pytest.skip("No cameras connected")
+        raise
+
+    yield camera
+    camera.disconnect()
+
+
 class TestSpinnakerCameraWrapper:
     """Test our SpinnakerCamera wrapper class."""
 
     def test_spinnaker_camera_connect_disconnect(self) -> None:
         """Test SpinnakerCamera connect and disconnect."""
-        from camera.spinnaker import SPINNAKER_AVAILABLE, SpinnakerCamera
-
-        if not SPINNAKER_AVAILABLE:
+        if not _SPIN_WRAP:
             pytest.skip("Spinnaker not available")
 
         camera = SpinnakerCamera()
@@ -415,44 +489,16 @@ class TestSpinnakerCameraWrapper:
             camera.disconnect()
             assert not camera.is_connected
 
-    def test_spinnaker_camera_settings(self) -> None:
+    def test_spinnaker_camera_settings(self, connected_camera) -> None:
         """Test setting camera parameters."""
-        from camera.spinnaker import SPINNAKER_AVAILABLE, SpinnakerCamera
+        camera = connected_camera
+        camera.set_exposure(10000)
+        camera.set_gain(0.0)
+        camera.set_fps(30)
 
-        if not SPINNAKER_AVAILABLE:
-            pytest.skip("Spinnaker not available")
-
-        camera = SpinnakerCamera()
-
-        try:
-            camera.connect()
-        except RuntimeError as e:
-            if "No cameras" in str(e):
-                pytest.skip("No cameras connected")
-            raise
-
-        try:
-            camera.set_exposure(10000)
-            camera.set_gain(0.0)
-            camera.set_fps(30)
-        finally:
-            camera.disconnect()
-
-    def test_spinnaker_camera_single_frame(self) -> None:
+    def test_spinnaker_camera_single_frame(self, connected_camera) -> None:
         """Test acquiring a single frame with SpinnakerCamera."""
-        from camera.spinnaker import SPINNAKER_AVAILABLE, SpinnakerCamera
-
-        if not SPINNAKER_AVAILABLE:
-            pytest.skip("Spinnaker not available")
-
-        camera = SpinnakerCamera()
-
-        try:
-            camera.connect()
-        except RuntimeError as e:
-            if "No cameras" in str(e):
-                pytest.skip("No cameras connected")
-            raise
+        camera = connected_camera
 
         try:
             camera.start_acquisition()
@@ -467,23 +513,13 @@ class TestSpinnakerCameraWrapper:
             camera.stop_acquisition()
             assert not camera.is_acquiring
         finally:
-            camera.disconnect()
+            # Leave the shared camera idle for the next test
+            if camera.is_acquiring:
+                camera.stop_acquisition()
 
-    def test_spinnaker_camera_multiple_frames(self) -> None:
+    def test_spinnaker_camera_multiple_frames(self, connected_camera) -> None:
         """Test acquiring multiple frames with SpinnakerCamera."""
-        from camera.spinnaker import SPINNAKER_AVAILABLE, SpinnakerCamera
-
-        if not SPINNAKER_AVAILABLE:
-            pytest.skip("Spinnaker not available")
-
-        camera = SpinnakerCamera()
-
-        try:
-            camera.connect()
-        except RuntimeError as e:
-            if "No cameras" in str(e):
-                pytest.skip("No cameras connected")
-            raise
+        camera = connected_camera
 
         try:
             camera.start_acquisition()
@@ -504,4 +540,5 @@ class TestSpinnakerCameraWrapper:
                 assert frame.shape[1] > 0
 
         finally:
-            camera.disconnect()
+            if camera.is_acquiring:
+                camera.stop_acquisition()